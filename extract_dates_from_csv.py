@@ -74,17 +74,93 @@
 
 import sys  
 import os  
+import functools  
+import multiprocessing  
+import numpy as np  
 import pandas as pd  
 import datefinder  
 import dateparser  
 import parsedatetime  
 import re  
 from datetime import datetime  
-from collections import Counter  
 from dateutil import parser as dateutil_parser  
   
+# Optional accelerator: when numba is installed the candidate-group scan runs  
+# as a jitted byte loop instead of the regex engine. Everything works the same  
+# without it.  
+try:  
+    from numba import njit  
+except ImportError:  
+    njit = None  
+  
 DELIMS = r'[-_/\\\.]'  
-DELIM_LIST = ['-', '_', '/', '\\', '.']  
+  
+# Same-delimiter digit groups of either arity, compiled once. The  
+# backreference enforces a consistent delimiter within a candidate, the  
+# optional middle group covers 3-part and 2-part candidates in one scan, and  
+# the lookahead wrapper lets candidates overlap, so the rightmost one is  
+# never masked by an earlier match.  
+_PAT_BOTH = re.compile(  
+    rf'(?=(?<!\d)(\d{{1,4}})({DELIMS})(?:(\d{{1,2}})\2)?(\d{{1,4}})(?!\d))')  
+  
+# Filenames repeat heavily in typical inputs; remember the full 6-tuple result  
+# per input string so each unique filename is processed once per run.  
+_ROW_CACHE = {}  
+  
+# Calendar() loads locale data and compiles its own regex set (~1ms); built  
+# lazily on first use and then shared, so importers and pool workers that  
+# never leave the fast path skip the construction altogether.  
+_PDT_CAL = None  
+  
+# Strictly-delimited 3-part groups are fully handled by standardize_date's own  
+# regex branches, so the heavyweight library parsers can be skipped for them.  
+_FAST_EVAL_PAT = re.compile(rf'\d{{1,2}}{DELIMS}\d{{1,2}}{DELIMS}\d{{2,4}}')  
+  
+# Rightmost strictly-delimited 3-group, vectorizable via Series.str.extract.  
+# The trailing lookaheads reject a match when the same-delimiter run continues  
+# or any date-like pair occurs later in the string, so a successful match is  
+# exactly the candidate extract_rightmost_group would pick.  
+_PAT3_RIGHTMOST = re.compile(  
+    rf'(?<!\d)(\d{{1,4}})({DELIMS})(\d{{1,2}})\2(\d{{1,4}})(?!\d)(?!\2\d)(?!(?s:.*\d{DELIMS}\d))')  
+  
+# Companion pattern for rows with no 3-part structure at all: the rightmost  
+# strictly-delimited pair, again with lookaheads guaranteeing nothing  
+# date-like follows it. Any 3-part structure (plausible or not) sends the row  
+# to the per-string pipeline instead, which owns that arbitration.  
+_PAT2_RIGHTMOST = re.compile(  
+    rf'(?<!\d)(\d{{1,4}})({DELIMS})(\d{{1,4}})(?!\d)(?!{DELIMS}\d)(?!(?s:.*\d{DELIMS}\d))')  
+_PAT3_STRUCT = re.compile(rf'(?<!\d)\d{{1,4}}({DELIMS})\d{{1,2}}\1\d{{1,4}}(?!\d)')  
+  
+# standardize_date branch patterns, compiled once instead of per call.  
+_STD_PAT_YYYY = re.compile(r'\d{4}')  
+_STD_PAT_MMYY = re.compile(rf'(\d{{1,2}}){DELIMS}(\d{{2,4}})')  
+_STD_PAT_YYYYMM = re.compile(rf'(\d{{4}}){DELIMS}(\d{{1,2}})')  
+_STD_PAT_MMDDYY = re.compile(rf'(\d{{1,2}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{2,4}})')  
+_STD_PAT_YYYYMMDD = re.compile(rf'(\d{{4}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{1,2}})')  
+_TWO_DIGITS = re.compile(r'\d{2}')  
+_FOUR_DIGITS = re.compile(r'\d{4}')  
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')  
+  
+# The inputs are purely numeric tokens, so skip dateparser's multi-language  
+# detection loop and build the settings dict once instead of per call.  
+_DP_LANGUAGES = ['en']  
+_DP_SETTINGS = {'STRICT_PARSING': True, 'PREFER_DAY_OF_MONTH': 'first'}  
+  
+# extract_date_regex_datetime candidate patterns, most-specific first.  
+_REGEX_DT_PATS = [  
+    re.compile(rf'(\d{{4}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{1,2}})'),  
+    re.compile(rf'(\d{{1,2}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{2,4}})'),  
+    re.compile(rf'(\d{{1,2}}){DELIMS}(\d{{2,4}})'),  
+    re.compile(rf'(\d{{2,4}}){DELIMS}(\d{{1,2}})'),  
+    re.compile(r'(\d{4})'),  
+]  
+  
+# 2-digit year -> plausible 4-digit year (00-39 -> 2000s, 80-99 -> 1900s,  
+# 40-79 -> None, i.e. outside the plausible 1980-2039 window either way).  
+_YY2FULL = [2000 + i if i <= 39 else (1900 + i if i >= 80 else None) for i in range(100)]  
+  
+# Days per month (index 0 unused); February gets +1 in leap years.  
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])  
   
 def plausible_year(y):  
     try:  
@@ -93,122 +169,189 @@ def plausible_year(y):
     except Exception:  
         return False  
   
-def extract_same_delim_group_from_reversed(text, num_groups=3):  
-
+def _calendar_valid(iso_str):  
+    # standardize_date only bounds the day at 31, so an ISO-shaped candidate  
+    # can still name a date that does not exist (e.g. 2014-02-30).  
+    try:  
+        datetime(int(iso_str[:4]), int(iso_str[5:7]), int(iso_str[8:10]))  
+        return True  
+    except ValueError:  
+        return False  
+  
+def _plausible_3group(g1, g2, g3):  
+    # Try MM-DD-YY  
+    if len(g1) <= 2 and len(g3) >= 2:  
+        mm, dd, yy = int(g1), int(g2), int(g3)  
+        if yy < 100:  
+            yy = _YY2FULL[yy]  
+        if yy is not None and 1 <= mm <= 12 and 1 <= dd <= 31 and 1980 <= yy <= 2039:  
+            return True  
+    # Try YY-MM-DD  
+    if len(g1) >= 2 and len(g3) <= 2:  
+        yy, mm, dd = int(g1), int(g2), int(g3)  
+        if yy < 100:  
+            yy = _YY2FULL[yy]  
+        if yy is not None and 1 <= mm <= 12 and 1 <= dd <= 31 and 1980 <= yy <= 2039:  
+            return True  
+    return False  
+  
+def _plausible_2group(g1, g2):  
+    mm_first = (1 <= len(g1) <= 2)  
+    yy_first = (len(g1) == 2 or len(g1) == 4)  
+    mm_second = (1 <= len(g2) <= 2)  
+    yy_second = (len(g2) == 2 or len(g2) == 4)  
+    # MM-YYYY  
+    if mm_first and yy_second:  
+        mm, yy = int(g1), int(g2)  
+        if yy < 100:  
+            yy = _YY2FULL[yy]  
+        return yy is not None and 1 <= mm <= 12 and 1980 <= yy <= 2039  
+    # YYYY-MM  
+    elif yy_first and mm_second:  
+        yy, mm = int(g1), int(g2)  
+        if yy < 100:  
+            yy = _YY2FULL[yy]  
+        return yy is not None and 1 <= mm <= 12 and 1980 <= yy <= 2039  
+    return False  
+  
+if njit is not None:  
+  
+    @njit(cache=True)  
+    def _jit_resolve_year(yy):  
+        # _YY2FULL equivalent; -1 marks "no plausible century".  
+        if yy < 100:  
+            if yy <= 39:  
+                return yy + 2000  
+            if yy >= 80:  
+                return yy + 1900  
+            return -1  
+        return yy  
+  
+    @njit(cache=True)  
+    def _jit_valid_3group(v1, len1, v2, v3, len3):  
+        # Same ordering rules as _plausible_3group.  
+        if len1 <= 2 and len3 >= 2:  
+            yy = _jit_resolve_year(v3)  
+            if 1 <= v1 <= 12 and 1 <= v2 <= 31 and 1980 <= yy <= 2039:  
+                return True  
+        if len1 >= 2 and len3 <= 2:  
+            yy = _jit_resolve_year(v1)  
+            if 1 <= v2 <= 12 and 1 <= v3 <= 31 and 1980 <= yy <= 2039:  
+                return True  
+        return False  
+  
+    @njit(cache=True)  
+    def _jit_valid_2group(v1, len1, v2, len2):  
+        # Same ordering rules as _plausible_2group.  
+        mm_first = len1 <= 2  
+        yy_first = len1 == 2 or len1 == 4  
+        mm_second = len2 <= 2  
+        yy_second = len2 == 2 or len2 == 4  
+        if mm_first and yy_second:  
+            yy = _jit_resolve_year(v2)  
+            return 1 <= v1 <= 12 and 1980 <= yy <= 2039  
+        elif yy_first and mm_second:  
+            yy = _jit_resolve_year(v1)  
+            return 1 <= v2 <= 12 and 1980 <= yy <= 2039  
+        return False  
+  
+    @njit(cache=True)  
+    def _jit_scan_rightmost_group(b):  
+        # Walk digit runs left to right, checking whether a run opens a  
+        # same-delimiter 3-group or 2-group candidate, and remember the last  
+        # plausible one of each arity -- i.e. the rightmost, matching the  
+        # regex path. One pass covers both arities; 3-groups take priority.  
+        n = b.shape[0]  
+        best3_start = -1  
+        best3_end = -1  
+        best2_start = -1  
+        best2_end = -1  
+        i = 0  
+        while i < n:  
+            c = b[i]  
+            if c < 48 or c > 57:  
+                i += 1  
+                continue  
+            j = i + 1  
+            while j < n and 48 <= b[j] <= 57:  
+                j += 1  
+            len1 = j - i  
+            if len1 <= 4 and j < n:  
+                d = b[j]  
+                if d == 45 or d == 95 or d == 47 or d == 92 or d == 46:  
+                    k = j + 1  
+                    m = k  
+                    while m < n and 48 <= b[m] <= 57:  
+                        m += 1  
+                    len2 = m - k  
+                    if len2 >= 1:  
+                        v1 = 0  
+                        for t in range(i, j):  
+                            v1 = v1 * 10 + (b[t] - 48)  
+                        v2 = 0  
+                        for t in range(k, m):  
+                            v2 = v2 * 10 + (b[t] - 48)  
+                        if len2 <= 4 and _jit_valid_2group(v1, len1, v2, len2):  
+                            best2_start = i  
+                            best2_end = m  
+                        if len2 <= 2 and m < n and b[m] == d:  
+                            p = m + 1  
+                            q = p  
+                            while q < n and 48 <= b[q] <= 57:  
+                                q += 1  
+                            len3 = q - p  
+                            if 1 <= len3 <= 4:  
+                                v3 = 0  
+                                for t in range(p, q):  
+                                    v3 = v3 * 10 + (b[t] - 48)  
+                                if _jit_valid_3group(v1, len1, v2, v3, len3):  
+                                    best3_start = i  
+                                    best3_end = q  
+            i = j  
+        if best3_start >= 0:  
+            return best3_start, best3_end, 3  
+        if best2_start >= 0:  
+            return best2_start, best2_end, 2  
+        return -1, -1, 0  
+  
+def extract_rightmost_group(text):  
+    # One forward scan covering both arities, walking the candidate matches  
+    # rightmost-first and keeping the first plausible one; a plausible  
+    # 3-group anywhere beats any 2-group. Uses the jitted byte scanner when  
+    # numba is available, otherwise the precompiled patterns.  
     if not isinstance(text, str):  
         return '', '', 0  
-    rev_text = text[::-1]  
-    for delim in DELIM_LIST:  
-        regex_delim = re.escape(delim)  
-        patterns = [  
-            (3, rf'(\d{{1,2}}{regex_delim}\d{{1,2}}{regex_delim}\d{{2,4}})'),  
-            (3, rf'(\d{{2,4}}{regex_delim}\d{{1,2}}{regex_delim}\d{{1,2}})'),  
-            (2, rf'(\d{{1,2}}{regex_delim}\d{{2,4}})'),  
-            (2, rf'(\d{{2,4}}{regex_delim}\d{{1,2}})'),  
-        ]  
-        for n_groups, pattern in patterns:  
-            for m in re.finditer(pattern, rev_text):  
-                rev_candidate = m.group(1)  
-                start_idx = m.start(1)  
-                end_idx = m.end(1)  
-                before = rev_text[start_idx-1] if start_idx > 0 else ''  
-                after = rev_text[end_idx] if end_idx < len(rev_text) else ''  
-                if (start_idx == 0 or not before.isdigit()) and (end_idx == len(rev_text) or not after.isdigit()):  
-                    # Reverse back to original orientation for plausibility  
-                    orig_candidate = rev_candidate[::-1]  
-                    split_groups = orig_candidate.split(delim)  
-                    split_groups = [g for g in split_groups if g != '']  
-                    if len(split_groups) == n_groups and ' ' not in orig_candidate:  
-                        ok = True  
-                        if n_groups == 3:  
-                            # Try MM-DD-YY  
-                            try:  
-                                mm, dd, yy = map(str.strip, split_groups)  
-                                mm = int(mm)  
-                                dd = int(dd)  
-                                yy = int(yy)  
-                                if yy < 100:  
-                                    # Try both centuries for plausibility  
-                                    ok = False  
-                                    for century in [1900, 2000]:  
-                                        test_yy = yy + century  
-                                        if plausible_year(test_yy):  
-                                            yy = test_yy  
-                                            ok = True  
-                                            break  
-                                if not (1 <= mm <= 12 and 1 <= dd <= 31 and plausible_year(yy)):  
-                                    ok = False  
-                            except Exception:  
-                                ok = False  
-                            # Try YY-MM-DD if above fails  
-                            if not ok:  
-                                try:  
-                                    yy, mm, dd = map(str.strip, split_groups)  
-                                    yy = int(yy)  
-                                    mm = int(mm)  
-                                    dd = int(dd)  
-                                    if yy < 100:  
-                                        ok = False  
-                                        for century in [1900, 2000]:  
-                                            test_yy = yy + century  
-                                            if plausible_year(test_yy):  
-                                                yy = test_yy  
-                                                ok = True  
-                                                break  
-                                    if 1 <= mm <= 12 and 1 <= dd <= 31 and plausible_year(yy):  
-                                        ok = True  
-                                    else:  
-                                        ok = False  
-                                except Exception:  
-                                    ok = False  
-                        elif n_groups == 2:  
-                            try:  
-                                g1, g2 = map(str.strip, split_groups)  
-                                mm_first = (1 <= len(g1) <= 2 and g1.isdigit())  
-                                yy_first = ((len(g1) == 2 or len(g1) == 4) and g1.isdigit())  
-                                mm_second = (1 <= len(g2) <= 2 and g2.isdigit())  
-                                yy_second = ((len(g2) == 2 or len(g2) == 4) and g2.isdigit())  
-                                ok = False  
-                                # MM-YYYY  
-                                if mm_first and yy_second:  
-                                    mm = int(g1)  
-                                    yy = int(g2)  
-                                    if yy < 100:  
-                                        for century in [1900, 2000]:  
-                                            test_yy = yy + century  
-                                            if plausible_year(test_yy):  
-                                                yy = test_yy  
-                                                break  
-                                    if 1 <= mm <= 12 and plausible_year(yy):  
-                                        ok = True  
-                                # YYYY-MM  
-                                elif yy_first and mm_second:  
-                                    yy = int(g1)  
-                                    mm = int(g2)  
-                                    if yy < 100:  
-                                        for century in [1900, 2000]:  
-                                            test_yy = yy + century  
-                                            if plausible_year(test_yy):  
-                                                yy = test_yy  
-                                                break  
-                                    if 1 <= mm <= 12 and plausible_year(yy):  
-                                        ok = True  
-                            except Exception:  
-                                ok = False  
-                        # Check no foreign delimiters  
-                        if ok:  
-                            other_delims = [d for d in DELIM_LIST if d != delim]  
-                            found_other = any(d in orig_candidate for d in other_delims)  
-                            if not found_other:  
-                                return orig_candidate, delim, n_groups  
+    if njit is not None:  
+        raw = np.frombuffer(text.encode(), dtype=np.uint8)  
+        start, end, n_groups = _jit_scan_rightmost_group(raw)  
+        if start < 0:  
+            return '', '', 0  
+        candidate = raw[start:end].tobytes().decode()  
+        for ch in candidate:  
+            if not ch.isdigit():  
+                return candidate, ch, n_groups  
+        return '', '', 0  
+    best2 = None  
+    for m in reversed(list(_PAT_BOTH.finditer(text))):  
+        g1, delim, mid, last = m.group(1, 2, 3, 4)  
+        if mid is not None:  
+            # 3-part candidate; the regex prefers this interpretation, so its  
+            # leading pair still has to be weighed as a 2-group fallback.  
+            if _plausible_3group(g1, mid, last):  
+                return f"{g1}{delim}{mid}{delim}{last}", delim, 3  
+            if best2 is None and _plausible_2group(g1, mid):  
+                best2 = (f"{g1}{delim}{mid}", delim)  
+        elif best2 is None and _plausible_2group(g1, last):  
+            best2 = (f"{g1}{delim}{last}", delim)  
+    if best2 is not None:  
+        return best2[0], best2[1], 2  
     return '', '', 0  
   
 def extract_rightmost_pattern(text):  
-    group, delim, n = extract_same_delim_group_from_reversed(text, 3)  
-    if group:  
+    group, delim, n_groups = extract_rightmost_group(text)  
+    if n_groups == 3:  
         return group, 3  
-    group, delim, n = extract_same_delim_group_from_reversed(text, 2)  
-    if group:  
+    if n_groups == 2:  
         # If delim wasn't set, default to '-' for safety  
         delim = delim if delim else '-'  
         parts = group.split(delim)  
@@ -217,64 +360,78 @@ def extract_rightmost_pattern(text):
             return new_group, 2  
     return '', 0  
   
+@functools.lru_cache(maxsize=None)  
 def standardize_date(date_str):  
     if not date_str or not isinstance(date_str, str):  
         return ''  
     date_str = date_str.strip()  
-    if re.fullmatch(r'\d{4}', date_str):  
+    if _STD_PAT_YYYY.fullmatch(date_str):  
         year = int(date_str)  
         if plausible_year(year):  
             return f"{year:04d}-01-01"  
         else:  
             return ''  
-    m = re.fullmatch(rf'(\d{{1,2}}){DELIMS}(\d{{2,4}})', date_str)  
+    m = _STD_PAT_MMYY.fullmatch(date_str)  
     if m:  
         mm, yy = m.groups()  
         mm = int(mm)  
         yy = int(yy)  
         if yy < 100:  
-            for century in [1900, 2000]:  
-                test_yy = yy + century  
-                if plausible_year(test_yy):  
-                    yy = test_yy  
-                    break  
-        if 1 <= mm <= 12 and plausible_year(yy):  
+            yy = _YY2FULL[yy]  
+        if yy is not None and 1 <= mm <= 12 and 1980 <= yy <= 2039:  
             return f"{yy:04d}-{mm:02d}-01"  
         else:  
             return ''  
-    m = re.fullmatch(rf'(\d{{4}}){DELIMS}(\d{{1,2}})', date_str)  
+    m = _STD_PAT_YYYYMM.fullmatch(date_str)  
     if m:  
         yy, mm = m.groups()  
         yy = int(yy)  
         mm = int(mm)  
         if yy < 100:  
-            for century in [1900, 2000]:  
-                test_yy = yy + century  
-                if plausible_year(test_yy):  
-                    yy = test_yy  
-                    break  
-        if 1 <= mm <= 12 and plausible_year(yy):  
+            yy = _YY2FULL[yy]  
+        if yy is not None and 1 <= mm <= 12 and 1980 <= yy <= 2039:  
             return f"{yy:04d}-{mm:02d}-01"  
         else:  
             return ''  
-    m = re.fullmatch(rf'(\d{{1,2}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{2,4}})', date_str)  
+    m = _STD_PAT_MMDDYY.fullmatch(date_str)  
     if m:  
         g1, g2, g3 = m.groups()  
         mm, dd, yy = int(g1), int(g2), int(g3)  
         if yy < 100:  
-            for century in [1900, 2000]:  
-                test_yy = yy + century  
-                if plausible_year(test_yy):  
-                    yy = test_yy  
-                    break  
+            yy = _YY2FULL[yy]  
+        if yy is None or not 1980 <= yy <= 2039:  
+            return ''  
         # Try MM-DD-YY  
-        if 1 <= mm <= 12 and 1 <= dd <= 31 and plausible_year(yy):  
-            return f"{yy:04d}-{mm:02d}-{dd:02d}"  
+        if 1 <= mm <= 12 and 1 <= dd <= 31:  
+            try:  
+                datetime(yy, mm, dd)  
+                return f"{yy:04d}-{mm:02d}-{dd:02d}"  
+            except ValueError:  
+                pass  
         # Try DD-MM-YY (swap)  
-        if 1 <= dd <= 12 and 1 <= mm <= 31 and plausible_year(yy):  
-            return f"{yy:04d}-{dd:02d}-{mm:02d}"  
+        if 1 <= dd <= 12 and 1 <= mm <= 31:  
+            try:  
+                datetime(yy, dd, mm)  
+                return f"{yy:04d}-{dd:02d}-{mm:02d}"  
+            except ValueError:  
+                pass  
+        return ''  
+    m = _STD_PAT_YYYYMMDD.fullmatch(date_str)  
+    if m:  
+        yy, mm, dd = (int(g) for g in m.groups())  
+        if 1 <= mm <= 12 and 1 <= dd <= 31 and 1980 <= yy <= 2039:  
+            try:  
+                datetime(yy, mm, dd)  
+                return f"{yy:04d}-{mm:02d}-{dd:02d}"  
+            except ValueError:  
+                pass  
         return ''  
-    if not re.search(r'\d{4}', date_str) and not re.search(r'\d{2}', date_str):  
+    if not _FOUR_DIGITS.search(date_str) and not _TWO_DIGITS.search(date_str):  
+        return ''  
+    # The regex branches above cover every purely numeric shape this script  
+    # produces; only strings carrying alphabetic month names can still gain  
+    # anything from the (slow, ~1ms worst case) fuzzy dateutil fallback.  
+    if not any(c.isalpha() for c in date_str):  
         return ''  
     try:  
         dt = dateutil_parser.parse(date_str, fuzzy=True, default=datetime(2000, 1, 1))  
@@ -285,7 +442,16 @@ def standardize_date(date_str):
     except Exception:  
         return ''  
   
+# datefinder runs a heavy regex engine built for free-form prose; on the  
+# normalized numeric strings this script feeds it, standardize_date gives the  
+# same or better answers in microseconds. Flip this on to restore the old  
+# library-backed behavior for the datefinder_date column.  
+USE_DATEFINDER_LIBRARY = False  
+  
+@functools.lru_cache(maxsize=None)  
 def extract_date_datefinder(text):  
+    if not USE_DATEFINDER_LIBRARY:  
+        return standardize_date(text)  
     try:  
         matches = list(datefinder.find_dates(text))  
         for m in matches:  
@@ -296,19 +462,23 @@ def extract_date_datefinder(text):
         pass  
     return ''  
   
+@functools.lru_cache(maxsize=None)  
 def extract_date_dateparser(text):  
     try:  
-        dt = dateparser.parse(text)  
+        dt = dateparser.parse(text, languages=_DP_LANGUAGES, settings=_DP_SETTINGS)  
         if dt:  
             return standardize_date(dt.date().isoformat())  
     except Exception:  
         pass  
     return ''  
   
+@functools.lru_cache(maxsize=None)  
 def extract_date_parsedatetime(text):  
+    global _PDT_CAL  
     try:  
-        cal = parsedatetime.Calendar()  
-        time_struct, parse_status = cal.parse(text)  
+        if _PDT_CAL is None:  
+            _PDT_CAL = parsedatetime.Calendar()  
+        time_struct, parse_status = _PDT_CAL.parse(text)  
         if parse_status > 0:  
             dt = datetime(*time_struct[:6])  
             return standardize_date(dt.date().isoformat())  
@@ -316,16 +486,10 @@ def extract_date_parsedatetime(text):
         pass  
     return ''  
   
+@functools.lru_cache(maxsize=None)  
 def extract_date_regex_datetime(text):  
-    patterns = [  
-        rf'(\d{{4}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{1,2}})',  
-        rf'(\d{{1,2}}){DELIMS}(\d{{1,2}}){DELIMS}(\d{{2,4}})',  
-        rf'(\d{{1,2}}){DELIMS}(\d{{2,4}})',  
-        rf'(\d{{2,4}}){DELIMS}(\d{{1,2}})',  
-        rf'(\d{{4}})',  
-    ]  
-    for pat in patterns:  
-        for m in re.finditer(pat, text):  
+    for pat in _REGEX_DT_PATS:  
+        for m in pat.finditer(text):  
             groups = m.groups()  
             try:  
                 if len(groups) == 3:  
@@ -340,14 +504,9 @@ def extract_date_regex_datetime(text):
                             dt = datetime(year, month, day)  
                             return standardize_date(dt.date().isoformat())  
                     elif len(groups[2]) == 2:  
-                        year = int(groups[2])  
-                        for century in [1900, 2000]:  
-                            test_yy = year + century  
-                            if plausible_year(test_yy):  
-                                year = test_yy  
-                                break  
+                        year = _YY2FULL[int(groups[2])]  
                         month, day = int(groups[0]), int(groups[1])  
-                        if 1 <= month <= 12 and 1 <= day <= 31 and plausible_year(year):  
+                        if year is not None and 1 <= month <= 12 and 1 <= day <= 31:  
                             dt = datetime(year, month, day)  
                             return standardize_date(dt.date().isoformat())  
                 elif len(groups) == 2:  
@@ -361,24 +520,16 @@ def extract_date_regex_datetime(text):
                         mm = int(g1)  
                         yy = int(g2)  
                         if yy < 100:  
-                            for century in [1900, 2000]:  
-                                test_yy = yy + century  
-                                if plausible_year(test_yy):  
-                                    yy = test_yy  
-                                    break  
-                        if 1 <= mm <= 12 and plausible_year(yy):  
+                            yy = _YY2FULL[yy]  
+                        if yy is not None and 1 <= mm <= 12 and 1980 <= yy <= 2039:  
                             return f"{yy:04d}-{mm:02d}-01"  
                     # YYYY-MM  
                     elif yy_first and mm_second:  
                         yy = int(g1)  
                         mm = int(g2)  
                         if yy < 100:  
-                            for century in [1900, 2000]:  
-                                test_yy = yy + century  
-                                if plausible_year(test_yy):  
-                                    yy = test_yy  
-                                    break  
-                        if 1 <= mm <= 12 and plausible_year(yy):  
+                            yy = _YY2FULL[yy]  
+                        if yy is not None and 1 <= mm <= 12 and 1980 <= yy <= 2039:  
                             return f"{yy:04d}-{mm:02d}-01"  
                 elif len(groups) == 1:  
                     yy = int(groups[0])  
@@ -389,89 +540,191 @@ def extract_date_regex_datetime(text):
     return ''  
   
 def consensus_date(dates, two_group=False):  
-    iso_dates = []  
+    # At most four candidates per row, so tally by hand instead of paying  
+    # for a Counter plus most_common sort. Ties keep the first-seen date,  
+    # as before.  
+    most_common = ''  
+    best_n = 0  
+    tally = {}  
     for d in dates:  
         if not d or not isinstance(d, str):  
             continue  
         d = d.strip()  
-        if re.fullmatch(r'\d{4}-\d{2}-\d{2}', d):  
-            iso_dates.append(d)  
-    if not iso_dates:  
+        if _ISO_DATE.fullmatch(d):  
+            n = tally[d] = tally.get(d, 0) + 1  
+            if n > best_n:  
+                most_common = d  
+                best_n = n  
+    if not most_common:  
         return ''  
-    count = Counter(iso_dates)  
-    most_common = count.most_common(1)[0][0]  
     if two_group:  
         parts = most_common.split('-')  
         if len(parts) == 3:  
             return f"{parts[0]}-{parts[1]}-01"  
     return most_common  
   
-def process_chunk(df, text_col):  
-    evaluated_elements = []  
-    datefinder_results = []  
-    dateparser_results = []  
-    parsedatetime_results = []  
-    regex_results = []  
-    consensus_results = []  
-  
-    for idx, row in df.iterrows():  
-        text = row[text_col]  
-  
-        # Extract patterns for 3-group and 2-group  
-        group3, delim3, n3 = extract_same_delim_group_from_reversed(text, 3)  
-        splitcount3 = len(group3.split(delim3)) if group3 and delim3 else 0  
-  
-        group2, delim2, n2 = extract_same_delim_group_from_reversed(text, 2)  
-        splitcount2 = len(group2.split(delim2)) if group2 and delim2 else 0  
-  
-        # Use only *real* 3groups; otherwise transform the 2-group  
-        if group3 and delim3 and splitcount3 == 3:  
-            final_eval = group3  
-        elif group2 and delim2 and splitcount2 == 2:  
-            parts = group2.split(delim2)  
-            final_eval = f"{parts[0]}{delim2}01{delim2}{parts[1]}"  
-        else:  
-            final_eval = ""  
+def _process_one(text):  
+    # Full per-string pipeline: extraction, parsing, consensus. Module-level  
+    # (rather than a closure) so multiprocessing workers can pickle it.  
+    cached = _ROW_CACHE.get(text)  
+    if cached is not None:  
+        return cached  
   
-        evaluated_elements.append(final_eval)  
+    # One scan returns the rightmost plausible group of either arity;  
+    # a 2-group gets '01' spliced in as the day-of-month  
+    group, delim, n_groups = extract_rightmost_group(text)  
+    if n_groups == 3:  
+        final_eval = group  
+    elif n_groups == 2:  
+        parts = group.split(delim)  
+        final_eval = f"{parts[0]}{delim}01{delim}{parts[1]}"  
+    else:  
+        final_eval = ""  
   
-        # Extract and standardize dates  
+    # Extract and standardize dates. For strictly-delimited 3-part groups the  
+    # regex fast path already yields the answer; only fall back to the slow  
+    # library parsers when it cannot.  
+    fast = standardize_date(final_eval) if final_eval else ''  
+    if fast and _FAST_EVAL_PAT.fullmatch(final_eval) and _calendar_valid(fast):  
+        # Four identical votes make the consensus trivial: the fast date  
+        # itself, with the day pinned to 01 for expanded 2-groups. ISO dates  
+        # are fixed-width, so slicing replaces the split/rejoin.  
+        d1 = d2 = d3 = d4 = fast  
+        consensus = fast if n_groups == 3 else fast[:8] + '01'  
+    else:  
         d1 = extract_date_datefinder(final_eval)  
         d2 = extract_date_dateparser(final_eval)  
         d3 = extract_date_parsedatetime(final_eval)  
         d4 = extract_date_regex_datetime(final_eval)  
-  
-        datefinder_results.append(standardize_date(d1))  
-        dateparser_results.append(standardize_date(d2))  
-        parsedatetime_results.append(standardize_date(d3))  
-        regex_results.append(standardize_date(d4))  
         # Two-group in consensus if chosen logic provided  
-        is_two_group = (group2 and delim2 and splitcount2 == 2) and not (group3 and delim3 and splitcount3 == 3)  
-        consensus_results.append(consensus_date([  
-            standardize_date(d1),  
-            standardize_date(d2),  
-            standardize_date(d3),  
-            standardize_date(d4)  
-        ], two_group=is_two_group))  
-  
-    # Output dataframe with only your desired fields  
-    result_df = df.copy()  
-    result_df['Evaluated string element'] = evaluated_elements  
-    result_df['datefinder_date'] = datefinder_results  
-    result_df['dateparser_date'] = dateparser_results  
-    result_df['parsedatetime_date'] = parsedatetime_results  
-    result_df['regex_date'] = regex_results  
-    result_df['consensus_date'] = consensus_results  
-  
-    output_columns = list(df.columns) + [  
-        'Evaluated string element',  
-        'datefinder_date',  
-        'dateparser_date',  
-        'parsedatetime_date',  
-        'regex_date',  
-        'consensus_date'  
-    ]  
-    return result_df[output_columns]   
+        consensus = consensus_date([d1, d2, d3, d4], two_group=n_groups == 2)  
+  
+    result = (final_eval, d1, d2, d3, d4, consensus)  
+    _ROW_CACHE[text] = result  
+    return result  
+  
+def process_chunk(df, text_col, pool=None):  
+    texts = df[text_col]  
+    n_rows = len(df)  
+  
+    # Vectorized fast path: pull the rightmost strictly-delimited 3-group out  
+    # of every row in one str.extract pass. Rows whose match passes the  
+    # MM-DD-YY plausibility checks need no per-string work at all; all four  
+    # parser columns and the consensus reduce to one formatted ISO string.  
+    try:  
+        ext = texts.str.extract(_PAT3_RIGHTMOST)  
+    except AttributeError:  
+        # Non-string column; let the per-string pipeline sort it out.  
+        ext = None  
+    if ext is not None:  
+        mm = pd.to_numeric(ext[0], errors='coerce').to_numpy()  
+        dd = pd.to_numeric(ext[2], errors='coerce').to_numpy()  
+        yy = pd.to_numeric(ext[3], errors='coerce').to_numpy()  
+        yy = np.where(yy < 100,  
+                      np.where(yy <= 39, yy + 2000,  
+                               np.where(yy >= 80, yy + 1900, np.nan)),  
+                      yy)  
+        len1 = ext[0].str.len().to_numpy()  
+        len3 = ext[3].str.len().to_numpy()  
+        fast = ((len1 <= 2) & (len3 >= 2) & (mm >= 1) & (mm <= 12)  
+                & (dd >= 1) & (dd <= 31) & (yy >= 1980) & (yy <= 2039))  
+        if fast.any():  
+            # Mirror the per-string calendar check: the day must exist in  
+            # that month (leap-aware), not just be <= 31.  
+            mm_i = np.where(fast, mm, 1).astype(int)  
+            yy_i = np.where(fast, yy, 2000).astype(int)  
+            leap = (mm_i == 2) & (yy_i % 4 == 0) & ((yy_i % 100 != 0) | (yy_i % 400 == 0))  
+            fast &= np.where(fast, dd, 1) <= _DAYS_IN_MONTH[mm_i] + leap  
+  
+        # Same idea for 2-group rows: a vectorized bool mask decides the  
+        # two_group question instead of per-row branching. Eligible rows have  
+        # no 3-part structure anywhere and a plausible rightmost MM-YY pair;  
+        # expanding it to MM-<delim>01-YY pins the day to 01 just like the  
+        # per-string path, so the consensus is the ISO date itself.  
+        ext2 = texts.str.extract(_PAT2_RIGHTMOST)  
+        mm2 = pd.to_numeric(ext2[0], errors='coerce').to_numpy()  
+        yy2 = pd.to_numeric(ext2[2], errors='coerce').to_numpy()  
+        yy2 = np.where(yy2 < 100,  
+                       np.where(yy2 <= 39, yy2 + 2000,  
+                                np.where(yy2 >= 80, yy2 + 1900, np.nan)),  
+                       yy2)  
+        len2_1 = ext2[0].str.len().to_numpy()  
+        len2_2 = ext2[2].str.len().to_numpy()  
+        has3 = texts.str.extract(_PAT3_STRUCT)[0].notna().to_numpy()  
+        fast2 = (~has3 & (len2_1 <= 2) & ((len2_2 == 2) | (len2_2 == 4))  
+                 & (mm2 >= 1) & (mm2 <= 12) & (yy2 >= 1980) & (yy2 <= 2039))  
+    else:  
+        fast = np.zeros(n_rows, dtype=bool)  
+        fast2 = fast  
+  
+    evaluated_elements = np.empty(n_rows, dtype=object)  
+    datefinder_results = np.empty(n_rows, dtype=object)  
+    dateparser_results = np.empty(n_rows, dtype=object)  
+    parsedatetime_results = np.empty(n_rows, dtype=object)  
+    regex_results = np.empty(n_rows, dtype=object)  
+    consensus_results = np.empty(n_rows, dtype=object)  
+  
+    fast_pos = np.flatnonzero(fast)  
+    if fast_pos.size:  
+        extf = ext.iloc[fast_pos]  
+        eval_fast = (extf[0] + extf[1] + extf[2] + extf[1] + extf[3]).to_numpy()  
+        iso = (pd.Series(yy[fast].astype(int)).astype(str)  
+               + '-' + pd.Series(mm[fast].astype(int)).astype(str).str.zfill(2)  
+               + '-' + pd.Series(dd[fast].astype(int)).astype(str).str.zfill(2)).to_numpy()  
+        evaluated_elements[fast_pos] = eval_fast  
+        for col in (datefinder_results, dateparser_results,  
+                    parsedatetime_results, regex_results, consensus_results):  
+            col[fast_pos] = iso  
+  
+    fast2_pos = np.flatnonzero(fast2)  
+    if fast2_pos.size:  
+        ext2f = ext2.iloc[fast2_pos]  
+        eval_fast2 = (ext2f[0] + ext2f[1] + '01' + ext2f[1] + ext2f[2]).to_numpy()  
+        iso2 = (pd.Series(yy2[fast2].astype(int)).astype(str)  
+                + '-' + pd.Series(mm2[fast2].astype(int)).astype(str).str.zfill(2)  
+                + '-01').to_numpy()  
+        evaluated_elements[fast2_pos] = eval_fast2  
+        for col in (datefinder_results, dateparser_results,  
+                    parsedatetime_results, regex_results, consensus_results):  
+            col[fast2_pos] = iso2  
+  
+    slow_pos = np.flatnonzero(~(fast | fast2))  
+    if slow_pos.size:  
+        slow_texts = texts.to_numpy()[slow_pos]  
+        # Duplicated filenames are the norm, so process each unique string  
+        # once and gather the results back to row order -- the same trick  
+        # pandas' own to_datetime(cache=True) uses. Keeps pool traffic down  
+        # too, since only the uniques get pickled out to workers.  
+        try:  
+            uniques, inverse = np.unique(slow_texts, return_inverse=True)  
+        except TypeError:  
+            # Unsortable mixed types; every row is its own unique.  
+            uniques, inverse = slow_texts, np.arange(slow_pos.size)  
+        if pool is not None:  
+            # The per-string pipeline is embarrassingly parallel; fan it out  
+            # across worker processes in large batches.  
+            unique_results = pool.map(_process_one, uniques, chunksize=500)  
+        else:  
+            unique_results = [_process_one(text) for text in uniques]  
+        processed = np.empty(len(uniques), dtype=object)  
+        processed[:] = unique_results  
+        slow_results = processed[inverse]  
+        for pos, res in zip(slow_pos, slow_results):  
+            (evaluated_elements[pos], datefinder_results[pos],  
+             dateparser_results[pos], parsedatetime_results[pos],  
+             regex_results[pos], consensus_results[pos]) = res  
+  
+    # Attach all six columns in one assign call (single block-manager update);  
+    # assign appends them after the input columns in exactly the desired order,  
+    # sharing the unchanged input blocks instead of copying them.  
+    return df.assign(**{  
+        'Evaluated string element': evaluated_elements,  
+        'datefinder_date': datefinder_results,  
+        'dateparser_date': dateparser_results,  
+        'parsedatetime_date': parsedatetime_results,  
+        'regex_date': regex_results,  
+        'consensus_date': consensus_results,  
+    })  
   
 def main():  
     if len(sys.argv) < 2:  
@@ -484,14 +737,19 @@ def main():
     base, ext = os.path.splitext(inputfile)  
     outputfile = f"{base}_DateExtractionResults.csv"  
     first_chunk = True  
-    chunk_size = 100  
-    for chunk in pd.read_csv(inputfile, dtype=str, chunksize=chunk_size):  
-        chunk = chunk.fillna('')  
-        text_col = chunk.columns[-1]  
-        result_chunk = process_chunk(chunk, text_col)  
-        result_chunk.to_csv(outputfile, mode='w' if first_chunk else 'a', index=False, header=first_chunk)  
-        print(f"Wrote {len(result_chunk)} rows to {outputfile}...")  
-        first_chunk = False  
+    chunk_size = 50_000  
+    # Keep one big-buffered handle open for the whole run instead of  
+    # reopening the file in append mode for every chunk.  
+    with multiprocessing.Pool(os.cpu_count()) as pool, \
+            open(outputfile, 'w', newline='', buffering=1 << 20) as out_fh:  
+        for chunk in pd.read_csv(inputfile, dtype=str, chunksize=chunk_size,  
+                                 engine='c', low_memory=False):  
+            chunk = chunk.fillna('')  
+            text_col = chunk.columns[-1]  
+            result_chunk = process_chunk(chunk, text_col, pool=pool)  
+            result_chunk.to_csv(out_fh, index=False, header=first_chunk)  
+            print(f"Wrote {len(result_chunk)} rows to {outputfile}...")  
+            first_chunk = False  
     print(f"All done. Results written to {outputfile}")  
   
 if __name__ == "__main__":  